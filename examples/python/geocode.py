@@ -2,10 +2,21 @@
 CSV2GEO API - Python Geocoding Example
 """
 import requests
+from requests.adapters import HTTPAdapter
 
 API_KEY = "YOUR_API_KEY"
 BASE_URL = "https://csv2geo.com/api/v1"
 
+# One Session for the whole module: connections are kept alive and reused,
+# so only the first call pays the TCP + TLS handshake. Copy this pattern
+# rather than calling requests.get()/requests.post() per lookup.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Authorization": f"Bearer {API_KEY}",
+    "User-Agent": "csv2geo-example/1.0",
+})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
 
 def geocode(address: str) -> dict:
     """
@@ -17,12 +28,9 @@ def geocode(address: str) -> dict:
     Returns:
         dict: Geocoding result with lat/lng
     """
-    response = requests.get(
+    response = _SESSION.get(
         f"{BASE_URL}/geocode",
-        params={
-            "q": address,
-            "api_key": API_KEY
-        }
+        params={"q": address}
     )
     response.raise_for_status()
     return response.json()
@@ -39,12 +47,11 @@ def reverse_geocode(lat: float, lng: float) -> dict:
     Returns:
         dict: Address result
     """
-    response = requests.get(
+    response = _SESSION.get(
         f"{BASE_URL}/reverse",
         params={
             "lat": lat,
-            "lng": lng,
-            "api_key": API_KEY
+            "lng": lng
         }
     )
     response.raise_for_status()
@@ -61,9 +68,8 @@ def batch_geocode(addresses: list[str]) -> dict:
     Returns:
         dict: Batch geocoding results
     """
-    response = requests.post(
+    response = _SESSION.post(
         f"{BASE_URL}/geocode",
-        headers={"Authorization": f"Bearer {API_KEY}"},
         json={"addresses": addresses}
     )
     response.raise_for_status()
@@ -11,8 +11,9 @@ Usage:
     print(result.lat, result.lng)
 """
 
-from .client import Client
-from .models import GeocodeResult, Location, AddressComponents
+from typing import TYPE_CHECKING
+
+from .models import GeocodeResult, GeocodeRow, Location, AddressComponents
 from .exceptions import (
     CSV2GEOError,
     AuthenticationError,
@@ -21,10 +22,15 @@ from .exceptions import (
     APIError,
 )
 
+if TYPE_CHECKING:  # real import for type checkers / IDEs; lazy at runtime
+    from .client import Client, AsyncClient
+
 __version__ = "1.17.1"
 __all__ = [
     "Client",
+    "AsyncClient",
     "GeocodeResult",
+    "GeocodeRow",
     "Location",
     "AddressComponents",
     "CSV2GEOError",
@@ -33,3 +39,13 @@ __all__ = [
     "InvalidRequestError",
     "APIError",
 ]
+
+
+def __getattr__(name):
+    # Clients are imported on first access (PEP 562): .client pulls in
+    # requests/urllib3/ssl, a few hundred ms of cold start that code only
+    # touching the models or exceptions shouldn't pay.
+    if name in ("Client", "AsyncClient"):
+        from . import client
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
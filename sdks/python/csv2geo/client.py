@@ -1,10 +1,76 @@
 """CSV2GEO API Client."""
 
+import asyncio
+import gzip
+import importlib
+import json as json_module
+import random
+import sys
+import threading
 import time
-from typing import List, Optional, Union, Tuple
+from collections import OrderedDict, deque, namedtuple
+from typing import Iterator, List, Optional, Union, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 
-from .models import GeocodeResult, GeocodeResponse, BatchGeocodeResponse, Location
+
+# aiohttp, httpx and ijson are optional and each costs tens of ms to
+# import, so they are loaded on first use rather than with this module:
+# a plain sync Client never pays for them just because they're installed.
+def _require(module: str, extra: str, feature: str):
+    """Import an optional dependency, or raise ImportError with the extra
+    that provides it."""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            f"{feature} requires {module} — install with `pip install csv2geo[{extra}]`"
+        ) from None
+
+
+def _load_ijson():
+    """ijson (`pip install csv2geo[stream]`), or None if not installed."""
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
+
+
+# orjson decodes large batch bodies 2-3x faster than the stdlib and encodes
+# straight to bytes. Both loaders accept bytes, so response.content can be
+# handed over without a decode.
+def _stdlib_json_dumps(obj) -> bytes:
+    return json_module.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        # orjson rejects float/int subclasses that json.dumps encodes fine
+        # (e.g. np.float64 from zip(df.lat, df.lng) without
+        # OPT_SERIALIZE_NUMPY): fall back rather than fail where the
+        # stdlib encoder wouldn't.
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            return _stdlib_json_dumps(obj)
+except ImportError:  # optional — `pip install csv2geo[fast]`
+    orjson = None
+    _json_loads = json_module.loads
+    _json_dumps = _stdlib_json_dumps
+
+from .models import (
+    GeocodeResult,
+    GeocodeResponse,
+    GeocodeRow,
+    BatchGeocodeResponse,
+    Location,
+)
 from .exceptions import (
     CSV2GEOError,
     AuthenticationError,
@@ -28,6 +94,130 @@ except Exception:
     _SDK_VERSION = "0.0.0+source"
 _USER_AGENT = f"csv2geo-python/{_SDK_VERSION}"
 
+def _header_int(value) -> Optional[int]:
+    """Integer header value, or None if absent / malformed."""
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _backoff_delay(attempt: int, base: float, retry_after: int = None) -> float:
+    """Seconds to wait before retry number ``attempt + 1``.
+
+    A positive server-supplied Retry-After wins, capped at 60 s: retrying
+    sooner than the server asked is a guaranteed 429. Otherwise exponential
+    backoff capped at 60 s with jitter in [50%, 100%] so that clients
+    throttled at the same moment don't all come back at the same moment.
+    """
+    if retry_after is not None and retry_after > 0:
+        return min(retry_after, 60)
+    return min(60, (2 ** attempt) * base) * random.uniform(0.5, 1.0)
+
+
+def _is_exhausted_read_timeout(exc: Exception) -> bool:
+    """True for the requests ConnectionError wrapping a MaxRetryError whose
+    last failure was a read timeout: once urllib3 has retried a timeout
+    itself, requests reports it as a connection error, not Timeout."""
+    reason = getattr(exc.args[0] if exc.args else None, "reason", None)
+    return isinstance(reason, ReadTimeoutError)
+
+
+def _pair_to_dict(coord) -> dict:
+    return {"lat": coord[0], "lng": coord[1]}
+
+
+# Exact-type dispatch for reverse_batch() normalization: one dict lookup per
+# coordinate instead of an isinstance() cascade. Subclasses (namedtuples,
+# dict subclasses, ...) miss here and take _coordinate_to_dict().
+_COORD_CONVERTERS = {
+    tuple: _pair_to_dict,
+    list: _pair_to_dict,
+    dict: lambda c: c,
+    Location: Location.to_dict,
+}
+
+
+def _coordinates_from_array(coordinates) -> Optional[List[dict]]:
+    """Normalize an (N, 2) NumPy array of lat/lng rows, else return None.
+
+    numpy is never imported here: if the caller holds an ndarray, numpy is
+    already in sys.modules. tolist() converts to Python floats in C, which
+    skips per-element indexing and numpy-scalar boxing.
+    """
+    np = sys.modules.get("numpy")
+    if np is None or not isinstance(coordinates, np.ndarray):
+        return None
+    if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+        raise InvalidRequestError(
+            f"Coordinate array must have shape (N, 2), got {coordinates.shape}"
+        )
+    return [
+        {"lat": lat, "lng": lng}
+        for lat, lng in coordinates.astype(np.float64, copy=False).tolist()
+    ]
+
+
+def _coordinate_to_dict(coord) -> dict:
+    """Slow path of the _COORD_CONVERTERS dispatch, by isinstance()."""
+    if isinstance(coord, (tuple, list)):
+        return _pair_to_dict(coord)
+    if isinstance(coord, Location):
+        return coord.to_dict()
+    if isinstance(coord, dict):
+        return coord
+    raise InvalidRequestError(f"Invalid coordinate format: {type(coord)}")
+
+
+CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+# Sentinel so a cached "not found" (None) is distinguishable from a miss.
+_MISSING = object()
+
+
+class _LRUCache:
+    """Thread-safe LRU map for single-lookup results.
+
+    Hand-rolled over OrderedDict rather than functools.lru_cache because
+    geocode_batch() writes into it directly — lru_cache only fills itself
+    by calling the wrapped function.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
 
 class Client:
     """
@@ -58,8 +248,17 @@ class Client:
     # service and only honors internal keys.)
     DEFAULT_BASE_URL = "https://csv2geo.com/api/v1"
     DEFAULT_TIMEOUT = 30
+    DEFAULT_CACHE_SIZE = 1024
     MAX_RETRIES = 3
-    RETRY_DELAY = 1  # seconds
+    RETRY_DELAY = 1  # seconds; base of the exponential backoff
+    RETRY_STATUSES = (502, 503, 504)
+    # Connection pool sizing: pool_maxsize is the number of keep-alive
+    # sockets kept per host, so it should cover the caller's thread fan-out
+    # (urllib3's default of 10 logs "Connection pool is full" past that).
+    POOL_CONNECTIONS = 8
+    POOL_MAXSIZE = 64
+    # Request bodies smaller than this aren't worth compressing.
+    COMPRESS_MIN_BYTES = 1024
 
     def __init__(
         self,
@@ -67,6 +266,10 @@ class Client:
         base_url: str = None,
         timeout: int = None,
         auto_retry: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        rpm_limit: Optional[int] = None,
+        transport: str = "requests",
+        compress_requests: bool = False,
     ):
         """
         Initialize the CSV2GEO client.
@@ -75,44 +278,201 @@ class Client:
             api_key: Your CSV2GEO API key
             base_url: API base URL (default: https://csv2geo.com/api/v1)
             timeout: Request timeout in seconds (default: 30)
-            auto_retry: Automatically retry on rate limit (default: True)
+            auto_retry: Automatically retry on rate limit, 502/503/504,
+                timeouts and connection errors (default: True)
+            cache_size: Max geocode()/reverse() results kept in the in-process
+                LRU cache (default: 1024). 0 disables caching.
+            rpm_limit: Cap on requests per rolling 60 s window, enforced
+                locally before sending (default: None, no local cap).
+            transport: "requests" (default, HTTP/1.1 keep-alive) or "httpx"
+                (HTTP/2: concurrent calls from several threads share one
+                multiplexed connection). "httpx" needs
+                `pip install csv2geo[http2]`.
+            compress_requests: Gzip batch request bodies over 1 KB and send
+                them with Content-Encoding: gzip (default: False). Only
+                enable against an endpoint that accepts compressed bodies.
         """
         if not api_key:
             raise ValueError("API key is required")
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"transport must be 'requests' or 'httpx', not {transport!r}")
+        if transport == "httpx":
+            httpx = _require("httpx", "http2", 'transport="httpx"')
 
         self.api_key = api_key
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.auto_retry = auto_retry
+        self.compress_requests = compress_requests
 
-        self._session = requests.Session()
-        self._session.headers.update({
+        self.transport = transport
+        headers = {
             "Authorization": f"Bearer {self.api_key}",
             "User-Agent": _USER_AGENT,
             "Content-Type": "application/json",
-        })
+        }
+        if transport == "httpx":
+            self._session = httpx.Client(
+                http2=True,
+                headers=headers,
+                timeout=self.timeout,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                ),
+            )
+            self._body_kwarg = "content"
+            self._timeout_errors = httpx.TimeoutException
+            self._connection_errors = httpx.TransportError
+            # httpx's transport can only retry failed connects, so all
+            # retrying — 5xx, timeouts, dropped connections — happens in
+            # _request for this backend.
+            self._client_retry_statuses = self.RETRY_STATUSES
+            self._client_retries_errors = True
+        else:
+            self._session = requests.Session()
+            self._session.headers.update(headers)
+            adapter = HTTPAdapter(
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                max_retries=self._transport_retry(),
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            self._body_kwarg = "data"
+            self._timeout_errors = requests.exceptions.Timeout
+            self._connection_errors = requests.exceptions.ConnectionError
+            self._client_retry_statuses = ()
+            self._client_retries_errors = False
+
+        # Rate limit tracking: headers of the last response, read lazily
+        # through the rate_limit* properties.
+        self._rate_headers = {}
+
+        self._cache = _LRUCache(cache_size)
+
+        # Proactive throttling: send times inside the last 60 s (rpm_limit)
+        self._rpm_limit = rpm_limit
+        self._call_times = deque()
+        self._throttle_lock = threading.Lock()
+
+    def _wait_if_throttled(self) -> None:
+        """Sleep before sending rather than spend a round trip on a 429.
+
+        Two levels: the local rpm_limit sliding window, and — when
+        auto_retry is on — the last X-RateLimit-* headers seen. If those
+        say we are down to the last ~10% of the window (at least 2
+        requests) and it resets within 60 s, wait for the reset. Longer
+        resets (e.g. a daily quota) are left to the server to enforce.
+        """
+        delay = 0.0
+        if self._rpm_limit:
+            with self._throttle_lock:
+                now = time.monotonic()
+                while self._call_times and now - self._call_times[0] >= 60:
+                    self._call_times.popleft()
+                if len(self._call_times) >= self._rpm_limit:
+                    # Entries may be future-dated reservations from callers
+                    # still sleeping, so key off the rpm_limit-th most recent
+                    # slot, not the oldest: the window it opens is ours.
+                    delay = max(
+                        0.0, 60 - (now - self._call_times[-self._rpm_limit])
+                    )
+                # Reserve our slot at the time we will actually send.
+                self._call_times.append(now + delay)
+
+        if self.auto_retry:
+            remaining = _header_int(self.rate_limit_remaining)
+            reset = _header_int(self.rate_limit_reset)
+            if remaining is not None and reset is not None:
+                limit = _header_int(self.rate_limit) or 0
+                if remaining <= max(2, limit // 10):
+                    until_reset = reset - time.time()
+                    if 0 < until_reset <= 60:
+                        delay = max(delay, until_reset)
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def _transport_retry(self) -> Retry:
+        """urllib3 retry policy for connect/read failures and 502/503/504.
+
+        429 is deliberately left out of status_forcelist: _request handles
+        it with Retry-After awareness. respect_retry_after_header=False is
+        what actually keeps urllib3 off it — otherwise any 429/503 carrying
+        Retry-After is retried here too, uncapped, under each of _request's
+        own attempts. raise_on_status=False hands the last 5xx back to
+        _handle_response so it still surfaces as APIError.
+        """
+        if not self.auto_retry:
+            return Retry(total=0, raise_on_status=False)
+        return Retry(
+            total=self.MAX_RETRIES,
+            connect=self.MAX_RETRIES,
+            read=self.MAX_RETRIES,
+            status=self.MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
 
-        # Rate limit tracking
-        self.rate_limit = None
-        self.rate_limit_remaining = None
-        self.rate_limit_reset = None
+    @staticmethod
+    def _cache_key(kind: str, query, params: dict) -> tuple:
+        """Key for the single-lookup cache: normalized query plus every other
+        param that can change the answer (country, lang, include, radius)."""
+        extra = tuple(sorted(
+            (k, v) for k, v in params.items() if k not in ("q", "lat", "lng")
+        ))
+        return (kind, query) + extra
+
+    def cache_info(self) -> CacheInfo:
+        """Hit/miss statistics for the geocode()/reverse() cache."""
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Drop every cached geocode()/reverse() result and reset statistics."""
+        self._cache.clear()
+
+    @property
+    def rate_limit(self) -> Optional[str]:
+        """X-RateLimit-Limit from the last response."""
+        return self._rate_headers.get("X-RateLimit-Limit")
+
+    @property
+    def rate_limit_remaining(self) -> Optional[str]:
+        """X-RateLimit-Remaining from the last response."""
+        return self._rate_headers.get("X-RateLimit-Remaining")
+
+    @property
+    def rate_limit_reset(self) -> Optional[str]:
+        """X-RateLimit-Reset (Unix timestamp) from the last response."""
+        return self._rate_headers.get("X-RateLimit-Reset")
+
+    def _handle_response(
+        self, response: "requests.Response | httpx.Response", stream: bool = False
+    ) -> dict:
+        """Handle API response and raise appropriate exceptions.
 
-    def _handle_response(self, response: requests.Response) -> dict:
-        """Handle API response and raise appropriate exceptions."""
-        # Update rate limit info from headers
-        self.rate_limit = response.headers.get("X-RateLimit-Limit")
-        self.rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
-        self.rate_limit_reset = response.headers.get("X-RateLimit-Reset")
+        Runs on every call, so the success path does nothing beyond
+        keeping the headers and decoding; errors go to _handle_error.
+        With ``stream=True`` a 2xx response is returned unread, for the
+        caller to consume incrementally.
+        """
+        self._rate_headers = response.headers
 
         # Any 2xx is success. Async endpoints like /v1/batch return 202
         # (Accepted) on create + while polling pending/running; the
         # response body is still JSON we want to surface to the caller.
         if 200 <= response.status_code < 300:
-            return response.json()
+            return response if stream else _json_loads(response.content)
+        return self._handle_error(response)
 
-        # Handle errors
+    def _handle_error(self, response: "requests.Response | httpx.Response"):
+        """Raise the exception matching a non-2xx response."""
         try:
-            error_data = response.json().get("error", {})
+            error_data = _json_loads(response.content).get("error", {})
             code = error_data.get("code", "unknown")
             message = error_data.get("message", "Unknown error")
             status = error_data.get("status", response.status_code)
@@ -126,7 +486,7 @@ class Client:
         elif response.status_code == 403:
             raise PermissionError(message, code=code, status=status)
         elif response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
+            retry_after = _header_int(response.headers.get("Retry-After"))
             raise RateLimitError(
                 message, code=code, status=status, retry_after=retry_after
             )
@@ -141,34 +501,64 @@ class Client:
         endpoint: str,
         params: dict = None,
         json: dict = None,
-        retry_count: int = 0,
+        stream: bool = False,
+        body: bytes = None,
     ) -> dict:
-        """Make an API request with retry logic."""
-        url = f"{self.base_url}{endpoint}"
+        """Make an API request, retrying rate limits with backoff.
 
-        try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                timeout=self.timeout,
-            )
-            return self._handle_response(response)
-
-        except RateLimitError as e:
-            if self.auto_retry and retry_count < self.MAX_RETRIES:
-                wait_time = min(e.retry_after or self.RETRY_DELAY, 60)
-                time.sleep(wait_time)
-                return self._request(
-                    method, endpoint, params, json, retry_count + 1
-                )
-            raise
+        ``body`` is a pre-encoded JSON payload (see _json_dumps) sent
+        as-is instead of ``json``; batch methods use it to skip the
+        stdlib encoder on 10,000-item payloads.
 
-        except requests.exceptions.Timeout:
-            raise APIError("Request timed out", code="timeout")
-        except requests.exceptions.ConnectionError:
-            raise APIError("Connection failed", code="connection_error")
+        Connect/read failures and 502/503/504 are retried below us by the
+        session's urllib3 adapter (see _transport_retry); by the time one
+        reaches this method the retry budget is already spent. The httpx
+        transport has no equivalent, so there they are retried here.
+        """
+        url = f"{self.base_url}{endpoint}"
+        retries = self.MAX_RETRIES if self.auto_retry else 0
+        if params and self.transport == "httpx":
+            # requests drops None-valued params; httpx would send "q=".
+            params = {k: v for k, v in params.items() if v is not None}
+        headers = None
+        if body is not None and self.compress_requests and len(body) > self.COMPRESS_MIN_BYTES:
+            # Level 1: address lists still shrink 5-10x, for little CPU.
+            body = gzip.compress(body, compresslevel=1)
+            headers = {"Content-Encoding": "gzip"}
+        payload = {"json": json} if body is None else {self._body_kwarg: body}
+
+        for attempt in range(retries + 1):
+            self._wait_if_throttled()
+            try:
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                    **payload,
+                    **({"stream": True} if stream else {}),
+                )
+                return self._handle_response(response, stream=stream)
+
+            except RateLimitError as e:
+                if attempt == retries:
+                    raise
+                time.sleep(_backoff_delay(attempt, self.RETRY_DELAY, e.retry_after))
+            except APIError as e:
+                if attempt == retries or e.status not in self._client_retry_statuses:
+                    raise
+                time.sleep(_backoff_delay(attempt, self.RETRY_DELAY))
+            except self._timeout_errors:
+                if attempt == retries or not self._client_retries_errors:
+                    raise APIError("Request timed out", code="timeout")
+                time.sleep(_backoff_delay(attempt, self.RETRY_DELAY))
+            except self._connection_errors as e:
+                if _is_exhausted_read_timeout(e):
+                    raise APIError("Request timed out", code="timeout")
+                if attempt == retries or not self._client_retries_errors:
+                    raise APIError("Connection failed", code="connection_error")
+                time.sleep(_backoff_delay(attempt, self.RETRY_DELAY))
 
     def geocode(
         self,
@@ -198,7 +588,9 @@ class Client:
                 (e.g. "meta,other_names").
 
         Returns:
-            GeocodeResult or None if not found
+            GeocodeResult or None if not found. Answers are cached per
+            client, keyed on the case/whitespace-normalized address plus
+            the other arguments; see cache_info() / cache_clear().
 
         Example:
             result = client.geocode("1010 Vienna", country="AT", lang="de", include_other_names=True)
@@ -210,8 +602,14 @@ class Client:
             params["country"] = country
         self._merge_places_i18n(params, lang, include_other_names, include)
 
+        key = self._cache_key("geocode", address.strip().lower(), params)
+        cached = self._cache.get(key)
+        if cached is not _MISSING:
+            return cached
+
         data = self._request("GET", "/geocode", params=params)
         response = GeocodeResponse.from_dict(data)
+        self._cache.put(key, response.best)
         return response.best
 
     def geocode_full(
@@ -267,7 +665,8 @@ class Client:
                 street (≤500m, 0.7), postcode (≤1500m, 0.5).
 
         Returns:
-            GeocodeResult or None if not found
+            GeocodeResult or None if not found. Cached like geocode(), keyed
+            on coordinates rounded to 6 decimals (~0.1 m).
 
         Example:
             result = client.reverse(48.2082, 16.3738, lang="de", include_other_names=True)
@@ -281,8 +680,15 @@ class Client:
         self._merge_places_i18n(params, lang, include_other_names, include)
         if radius is not None:
             params["radius"] = radius
+
+        key = self._cache_key("reverse", (round(lat, 6), round(lng, 6)), params)
+        cached = self._cache.get(key)
+        if cached is not _MISSING:
+            return cached
+
         data = self._request("GET", "/reverse", params=params)
         response = GeocodeResponse.from_dict(data)
+        self._cache.put(key, response.best)
         return response.best
 
     def reverse_full(
@@ -322,16 +728,25 @@ class Client:
         lang: str = None,
         include_other_names: bool = False,
         include: str = None,
-    ) -> List[GeocodeResponse]:
+        raw: bool = False,
+    ) -> Union[List[GeocodeResponse], List[GeocodeRow]]:
         """
         Geocode multiple addresses in a single request.
 
         Args:
             addresses: List of addresses to geocode (max 10,000)
             lang: BCP-47 tag — applied to every result in the batch.
+            raw: Return flat GeocodeRow tuples (query, formatted_address,
+                lat, lng, accuracy, accuracy_score) of each best match
+                instead of GeocodeResponse objects. Much cheaper to build
+                for large batches; bypasses the geocode() cache.
 
         Returns:
-            List of GeocodeResponse objects
+            List of GeocodeResponse objects (GeocodeRow if raw), one per
+            input address in input order. Repeated addresses are sent once
+            and share a response. Addresses already in the geocode() cache
+            are not sent at all; their response carries just the cached
+            best match.
 
         Example:
             results = client.geocode_batch(
@@ -344,30 +759,173 @@ class Client:
 
         params = {}
         self._merge_places_i18n(params, lang, include_other_names, include)
-        data = self._request("POST", "/geocode", params=params, json={"addresses": addresses})
-        response = BatchGeocodeResponse.from_dict(data)
-        return response.results
+
+        if raw:
+            unique = list(dict.fromkeys(addresses))
+            data = self._request(
+                "POST", "/geocode", params=params,
+                body=_json_dumps({"addresses": unique}),
+            )
+            rows = GeocodeRow.list_from_batch(data)
+            if len(rows) == len(unique):
+                if len(unique) == len(addresses):
+                    return rows
+                by_address = dict(zip(unique, rows))
+            else:
+                # Positions can't be trusted; match on the echoed query.
+                by_address = {r.query: r for r in rows}
+            return [
+                by_address[a] if a in by_address
+                else GeocodeRow(a, None, None, None, None, None)
+                for a in addresses
+            ]
+
+        # Deduplicate, and answer what we can from the single-lookup cache.
+        answers = {}
+        pending = []
+        for address in dict.fromkeys(addresses):
+            if not isinstance(address, str):
+                # None / NaN from a DataFrame column: sent as-is, never cached.
+                pending.append(address)
+                continue
+            key = self._cache_key("geocode", address.strip().lower(), params)
+            cached = self._cache.get(key)
+            if cached is _MISSING:
+                pending.append(address)
+            else:
+                answers[address] = GeocodeResponse(address, [cached] if cached else [])
+
+        if pending:
+            data = self._request(
+                "POST", "/geocode", params=params,
+                body=_json_dumps({"addresses": pending}),
+            )
+            results = BatchGeocodeResponse.from_dict(data).results
+            # Results are positional; fall back to the echoed query if the
+            # server ever returns a different count.
+            if len(results) == len(pending):
+                pairs = zip(pending, results)
+            else:
+                pairs = ((r.query, r) for r in results)
+            for address, r in pairs:
+                self._seed_geocode_cache(r, params)
+                answers[address] = r
+
+        return [
+            answers[a] if a in answers else GeocodeResponse(a, [])
+            for a in addresses
+        ]
+
+    def geocode_batch_iter(
+        self,
+        addresses: List[str],
+        lang: str = None,
+        include_other_names: bool = False,
+        include: str = None,
+    ) -> Iterator[GeocodeResponse]:
+        """
+        Like geocode_batch(), but yields results while the response streams in.
+
+        The body is parsed incrementally with ijson, so peak memory is one
+        result rather than the whole (up to 10,000-result) response, and
+        the first result is available as soon as its bytes arrive. Without
+        ijson (`pip install csv2geo[stream]`), or on transport="httpx",
+        the response is buffered and then yielded — same results, no
+        memory saving.
+
+        The request is validated and sent when this is called, so input
+        and HTTP errors raise here; only parsing is deferred to iteration.
+
+        Args:
+            addresses: List of addresses to geocode (max 10,000)
+            lang: BCP-47 tag — applied to every result in the batch.
+
+        Returns:
+            Iterator of GeocodeResponse objects, in input order
+
+        Example:
+            for r in client.geocode_batch_iter(addresses):
+                writer.writerow([r.query, r.best.lat if r.best else ""])
+        """
+        if len(addresses) > 10000:
+            raise InvalidRequestError("Maximum 10,000 addresses per batch request")
+
+        params = {}
+        self._merge_places_i18n(params, lang, include_other_names, include)
+        body = _json_dumps({"addresses": addresses})
+
+        ijson = _load_ijson() if self.transport == "requests" else None
+        if ijson is None:
+            data = self._request("POST", "/geocode", params=params, body=body)
+            return self._iter_batch_results(data.get("results", []), params)
+
+        response = self._request(
+            "POST", "/geocode", params=params, body=body, stream=True
+        )
+        # Let urllib3 undo any Content-Encoding before ijson sees the bytes.
+        response.raw.decode_content = True
+        items = ijson.items(response.raw, "results.item", use_float=True)
+        return self._iter_batch_results(items, params, response)
+
+    def _iter_batch_results(
+        self, items, params: dict, response=None
+    ) -> Iterator[GeocodeResponse]:
+        """Generator half of geocode_batch_iter(): parse each raw result,
+        seed the cache, and close the streamed response when done."""
+        try:
+            for item in items:
+                r = GeocodeResponse.from_dict(item)
+                self._seed_geocode_cache(r, params)
+                yield r
+        finally:
+            if response is not None:
+                response.close()
+
+    def _seed_geocode_cache(self, response: GeocodeResponse, params: dict) -> None:
+        """Seed the single-lookup cache from a batch result so a follow-up
+        geocode() of that address (same lang/include, no country filter)
+        skips the network."""
+        if response.best and isinstance(response.query, str):
+            self._cache.put(
+                self._cache_key("geocode", response.query.strip().lower(), params),
+                response.best,
+            )
+
+    def _seed_reverse_cache(self, coord: dict, response: GeocodeResponse, params: dict) -> None:
+        """reverse() counterpart of _seed_geocode_cache, keyed like reverse()."""
+        if not response.best:
+            return
+        try:
+            point = (round(coord["lat"], 6), round(coord["lng"], 6))
+        except (KeyError, TypeError):
+            return  # caller-supplied dict without numeric lat/lng
+        self._cache.put(self._cache_key("reverse", point, params), response.best)
 
     def reverse_batch(
         self,
-        coordinates: List[Union[Tuple[float, float], Location, dict]],
+        coordinates: List[Union[Tuple[float, float], List[float], Location, dict]],
         lang: str = None,
         include_other_names: bool = False,
         include: str = None,
         radius: int = None,
-    ) -> List[GeocodeResponse]:
+        raw: bool = False,
+    ) -> Union[List[GeocodeResponse], List[GeocodeRow]]:
         """
         Reverse geocode multiple coordinates in a single request.
 
         Args:
-            coordinates: List of coordinates as (lat, lng) tuples, Location objects,
-                        or dicts with 'lat' and 'lng' keys (max 10,000)
+            coordinates: List of coordinates as (lat, lng) tuples or lists,
+                        Location objects, or dicts with 'lat' and 'lng' keys;
+                        or a NumPy array of shape (N, 2) with lat, lng
+                        columns (max 10,000)
             radius: Search radius in meters (1-1500) applied to every coordinate
                 in the batch. See reverse() for the distance-to-accuracy band
                 mapping.
+            raw: Return flat GeocodeRow tuples instead of GeocodeResponse
+                objects. See geocode_batch().
 
         Returns:
-            List of GeocodeResponse objects
+            List of GeocodeResponse objects (GeocodeRow if raw)
 
         Example:
             results = client.reverse_batch([
@@ -382,25 +940,28 @@ class Client:
             raise InvalidRequestError("Maximum 10,000 coordinates per batch request")
 
         # Normalize coordinates to dict format
-        coords_list = []
-        for coord in coordinates:
-            if isinstance(coord, tuple):
-                coords_list.append({"lat": coord[0], "lng": coord[1]})
-            elif isinstance(coord, Location):
-                coords_list.append(coord.to_dict())
-            elif isinstance(coord, dict):
-                coords_list.append(coord)
-            else:
-                raise InvalidRequestError(
-                    f"Invalid coordinate format: {type(coord)}"
-                )
+        coords_list = _coordinates_from_array(coordinates)
+        if coords_list is None:
+            try:
+                coords_list = [_COORD_CONVERTERS[type(c)](c) for c in coordinates]
+            except KeyError:
+                coords_list = [_coordinate_to_dict(c) for c in coordinates]
 
         params = {}
         self._merge_places_i18n(params, lang, include_other_names, include)
         if radius is not None:
             params["radius"] = radius
-        data = self._request("POST", "/reverse", params=params, json={"coordinates": coords_list})
+        data = self._request(
+            "POST", "/reverse", params=params,
+            body=_json_dumps({"coordinates": coords_list}),
+        )
+        if raw:
+            return GeocodeRow.list_from_batch(data)
         response = BatchGeocodeResponse.from_dict(data)
+        # Results come back in input order, one per coordinate.
+        if len(response.results) == len(coords_list):
+            for coord, r in zip(coords_list, response.results):
+                self._seed_reverse_cache(coord, r, params)
         return response.results
 
     # ─────────────────────────────────────────────────────────
@@ -1597,3 +2158,374 @@ class Client:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class _AIMDSemaphore:
+    """Async semaphore whose limit adapts like TCP congestion control.
+
+    Additive increase: every completion with the latency EWMA at or under
+    ``target_latency`` widens the window by ``alpha``. Multiplicative
+    decrease: a slow completion or congestion signal (429 / 5xx) scales
+    it by ``beta``, at most once per window's worth of completions so one
+    burst of slow responses doesn't collapse it straight to ``c_min``.
+    Only ``int(limit)`` acquisitions are admitted at a time.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        c_min: int = 1,
+        c_max: int = 64,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        target_latency: float = 1.0,
+        smoothing: float = 0.2,
+    ):
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+        self.smoothing = smoothing
+        self.limit = float(min(c_max, max(c_min, initial)))
+        self.ewma_latency = None
+        self._in_flight = 0
+        self._completed = 0
+        self._last_decrease = None  # completion count at the last decrease
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def release(self, latency: float = None, congested: bool = False) -> None:
+        """Free a slot and feed back how the request went.
+
+        ``latency`` is the request's wall time (None if it failed for a
+        reason that says nothing about server load); ``congested`` marks
+        a rate-limit or server-side failure.
+        """
+        async with self._cond:
+            self._in_flight -= 1
+            self._completed += 1
+            if latency is not None:
+                if self.ewma_latency is None:
+                    self.ewma_latency = latency
+                else:
+                    self.ewma_latency += self.smoothing * (latency - self.ewma_latency)
+            if congested or (
+                self.ewma_latency is not None
+                and self.ewma_latency > self.target_latency
+            ):
+                if (self._last_decrease is None
+                        or self._completed - self._last_decrease >= int(self.limit)):
+                    self.limit = max(self.c_min, self.limit * self.beta)
+                    self._last_decrease = self._completed
+            elif latency is not None:
+                self.limit = min(self.c_max, self.limit + self.alpha)
+            self._cond.notify(max(0, int(self.limit) - self._in_flight))
+
+
+class AsyncClient:
+    """
+    asyncio CSV2GEO client for concurrent single-address lookups.
+
+    Same wire contract and response models as :class:`Client`; only the
+    transport changes (one pooled ``aiohttp.ClientSession``). Covers the
+    single-lookup endpoints — use :class:`Client` for batch, places,
+    routing, etc. Requires the ``async`` extra: ``pip install csv2geo[async]``.
+
+    Usage:
+        async with AsyncClient("your_api_key") as client:
+            result = await client.geocode("1600 Pennsylvania Ave, Washington DC")
+
+            # Fan out many lookups; results come back in input order
+            results = await client.geocode_many([
+                "1600 Pennsylvania Ave, Washington DC",
+                "350 Fifth Avenue, New York, NY",
+            ])
+    """
+
+    DEFAULT_BASE_URL = Client.DEFAULT_BASE_URL
+    DEFAULT_TIMEOUT = Client.DEFAULT_TIMEOUT
+    MAX_RETRIES = Client.MAX_RETRIES
+    RETRY_DELAY = Client.RETRY_DELAY
+    RETRY_STATUSES = Client.RETRY_STATUSES
+    DEFAULT_CONCURRENCY = 16
+    DEFAULT_MAX_CONCURRENCY = 64
+    DEFAULT_TARGET_LATENCY = 1.0  # seconds
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = None,
+        timeout: int = None,
+        auto_retry: bool = True,
+        concurrency: int = None,
+        max_concurrency: int = None,
+        target_latency: float = None,
+    ):
+        """
+        Initialize the async CSV2GEO client.
+
+        Args:
+            api_key: Your CSV2GEO API key
+            base_url: API base URL (default: https://csv2geo.com/api/v1)
+            timeout: Total request timeout in seconds (default: 30)
+            auto_retry: Automatically retry on rate limit, 502/503/504,
+                timeouts and connection errors (default: True)
+            concurrency: Starting number of in-flight requests for
+                geocode_many() (default: 16). Adjusted at runtime; see
+                geocode_many().
+            max_concurrency: Ceiling for the adaptive window (default: 64)
+            target_latency: Per-request latency, in seconds, above which
+                geocode_many() backs off (default: 1.0)
+        """
+        self._aiohttp = _require("aiohttp", "async", "AsyncClient")
+        if not api_key:
+            raise ValueError("API key is required")
+
+        self.api_key = api_key
+        self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
+        self.timeout = timeout or self.DEFAULT_TIMEOUT
+        self.auto_retry = auto_retry
+        self.concurrency = concurrency or self.DEFAULT_CONCURRENCY
+        self.max_concurrency = max_concurrency or self.DEFAULT_MAX_CONCURRENCY
+        self.target_latency = target_latency or self.DEFAULT_TARGET_LATENCY
+
+        # Created lazily: aiohttp sessions must be built inside a running loop.
+        self._session = None
+
+        # Rate limit tracking
+        self.rate_limit = None
+        self.rate_limit_remaining = None
+        self.rate_limit_reset = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            aiohttp = self._aiohttp
+            self._session = aiohttp.ClientSession(
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "User-Agent": _USER_AGENT,
+                    "Content-Type": "application/json",
+                },
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            )
+        return self._session
+
+    async def _handle_response(self, response: "aiohttp.ClientResponse") -> dict:
+        """Handle API response and raise appropriate exceptions."""
+        self.rate_limit = response.headers.get("X-RateLimit-Limit")
+        self.rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
+        self.rate_limit_reset = response.headers.get("X-RateLimit-Reset")
+
+        if 200 <= response.status < 300:
+            return _json_loads(await response.read())
+
+        text = await response.text()
+        try:
+            error_data = _json_loads(text).get("error", {})
+            code = error_data.get("code", "unknown")
+            message = error_data.get("message", "Unknown error")
+            status = error_data.get("status", response.status)
+        except (ValueError, AttributeError):
+            code = "unknown"
+            message = text or "Unknown error"
+            status = response.status
+
+        if response.status == 401:
+            raise AuthenticationError(message, code=code, status=status)
+        elif response.status == 403:
+            raise PermissionError(message, code=code, status=status)
+        elif response.status == 429:
+            retry_after = _header_int(response.headers.get("Retry-After"))
+            raise RateLimitError(
+                message, code=code, status=status, retry_after=retry_after
+            )
+        elif response.status == 400:
+            raise InvalidRequestError(message, code=code, status=status)
+        else:
+            raise APIError(message, code=code, status=status)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict = None,
+        json: dict = None,
+    ) -> dict:
+        """Make an API request, retrying transient failures with backoff."""
+        url = f"{self.base_url}{endpoint}"
+        retries = self.MAX_RETRIES if self.auto_retry else 0
+
+        for attempt in range(retries + 1):
+            last = attempt == retries
+            try:
+                async with self._get_session().request(
+                    method, url, params=params, json=json,
+                ) as response:
+                    return await self._handle_response(response)
+
+            except RateLimitError as e:
+                if last:
+                    raise
+                delay = _backoff_delay(attempt, self.RETRY_DELAY, e.retry_after)
+            except APIError as e:
+                if last or e.status not in self.RETRY_STATUSES:
+                    raise
+                delay = _backoff_delay(attempt, self.RETRY_DELAY)
+            except asyncio.TimeoutError:
+                if last:
+                    raise APIError("Request timed out", code="timeout")
+                delay = _backoff_delay(attempt, self.RETRY_DELAY)
+            except self._aiohttp.ClientConnectionError:
+                if last:
+                    raise APIError("Connection failed", code="connection_error")
+                delay = _backoff_delay(attempt, self.RETRY_DELAY)
+
+            await asyncio.sleep(delay)
+
+    _merge_places_i18n = Client._merge_places_i18n
+
+    async def geocode(
+        self,
+        address: str,
+        country: str = None,
+        lang: str = None,
+        include_other_names: bool = False,
+        include: str = None,
+    ) -> Optional[GeocodeResult]:
+        """Geocode a single address. See :meth:`Client.geocode`."""
+        response = await self.geocode_full(
+            address, country, lang, include_other_names, include
+        )
+        return response.best
+
+    async def geocode_full(
+        self,
+        address: str,
+        country: str = None,
+        lang: str = None,
+        include_other_names: bool = False,
+        include: str = None,
+    ) -> GeocodeResponse:
+        """Geocode a single address, returning all results. See :meth:`Client.geocode_full`."""
+        params = {"q": address}
+        if country:
+            params["country"] = country
+        self._merge_places_i18n(params, lang, include_other_names, include)
+
+        data = await self._request("GET", "/geocode", params=params)
+        return GeocodeResponse.from_dict(data)
+
+    async def reverse(
+        self,
+        lat: float,
+        lng: float,
+        lang: str = None,
+        include_other_names: bool = False,
+        include: str = None,
+        radius: int = None,
+    ) -> Optional[GeocodeResult]:
+        """Reverse geocode coordinates to an address. See :meth:`Client.reverse`."""
+        response = await self.reverse_full(
+            lat, lng, lang, include_other_names, include, radius
+        )
+        return response.best
+
+    async def reverse_full(
+        self,
+        lat: float,
+        lng: float,
+        lang: str = None,
+        include_other_names: bool = False,
+        include: str = None,
+        radius: int = None,
+    ) -> GeocodeResponse:
+        """Reverse geocode coordinates, returning all results. See :meth:`Client.reverse_full`."""
+        params = {"lat": lat, "lng": lng}
+        self._merge_places_i18n(params, lang, include_other_names, include)
+        if radius is not None:
+            params["radius"] = radius
+        data = await self._request("GET", "/reverse", params=params)
+        return GeocodeResponse.from_dict(data)
+
+    async def geocode_many(
+        self,
+        addresses: List[str],
+        country: str = None,
+        lang: str = None,
+        include_other_names: bool = False,
+        include: str = None,
+    ) -> List[Union[Optional[GeocodeResult], CSV2GEOError]]:
+        """
+        Geocode many addresses concurrently, one request per address.
+
+        Concurrency adapts AIMD-style (as in TCP congestion control): it
+        starts at ``concurrency``, grows by 0.5 per completed request while
+        latency stays under ``target_latency``, and halves on 429 / 5xx or
+        slow responses, within 1..``max_concurrency``. Useful when results
+        are needed incrementally or per-address errors must not fail the
+        whole set; for large offline jobs prefer ``Client.geocode_batch``.
+
+        Args:
+            addresses: Addresses to geocode
+            country, lang, include_other_names, include: As for geocode()
+
+        Returns:
+            One entry per input address, in input order: the best
+            GeocodeResult, None if not found, or the exception raised for
+            that address.
+
+        Example:
+            results = await client.geocode_many(addresses)
+            for address, r in zip(addresses, results):
+                if isinstance(r, Exception):
+                    print(address, "failed:", r)
+                elif r:
+                    print(address, r.lat, r.lng)
+        """
+        limiter = _AIMDSemaphore(
+            self.concurrency,
+            c_max=self.max_concurrency,
+            target_latency=self.target_latency,
+        )
+
+        async def one(address):
+            await limiter.acquire()
+            started = time.monotonic()
+            latency, congested = None, False
+            try:
+                result = await self.geocode(
+                    address, country, lang, include_other_names, include
+                )
+                latency = time.monotonic() - started
+                return result
+            except RateLimitError:
+                congested = True
+                raise
+            except APIError as e:
+                congested = e.status is None or e.status >= 500
+                raise
+            finally:
+                await limiter.release(latency, congested)
+
+        return await asyncio.gather(
+            *(one(a) for a in addresses), return_exceptions=True
+        )
+
+    async def close(self):
+        """Close the client session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -1,10 +1,16 @@
 """Data models for CSV2GEO API responses."""
 
+import sys
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, NamedTuple
 
+# Batch responses allocate tens of thousands of these; __slots__ drops the
+# per-instance __dict__. dataclass(slots=True) needs Python 3.10+, so older
+# interpreters just get regular dataclasses.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Location:
     """Geographic coordinates."""
     lat: float
@@ -17,7 +23,7 @@ class Location:
         return {"lat": self.lat, "lng": self.lng}
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AddressComponents:
     """Parsed address components."""
     house_number: Optional[str] = None
@@ -30,18 +36,19 @@ class AddressComponents:
 
     @classmethod
     def from_dict(cls, data: dict) -> "AddressComponents":
+        get = data.get
         return cls(
-            house_number=data.get("house_number"),
-            street=data.get("street"),
-            unit=data.get("unit"),
-            city=data.get("city"),
-            state=data.get("state"),
-            postcode=data.get("postcode"),
-            country=data.get("country"),
+            get("house_number"),
+            get("street"),
+            get("unit"),
+            get("city"),
+            get("state"),
+            get("postcode"),
+            get("country"),
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GeocodeResult:
     """A single geocoding result."""
     formatted_address: str
@@ -62,15 +69,19 @@ class GeocodeResult:
 
     @classmethod
     def from_dict(cls, data: dict) -> "GeocodeResult":
-        location = data.get("location", {})
+        # Hot path for batch parsing (one call per result): bind the lookups
+        # to locals and construct positionally.
+        get = data.get
+        location = get("location") or {}
+        loc_get = location.get
         return cls(
-            formatted_address=data.get("formatted_address", ""),
-            lat=location.get("lat", 0.0),
-            lng=location.get("lng", 0.0),
-            accuracy=data.get("accuracy", ""),
-            accuracy_score=data.get("accuracy_score", 0.0),
-            components=AddressComponents.from_dict(data.get("components", {})),
-            other_names=data.get("other_names") or {},
+            get("formatted_address", ""),
+            loc_get("lat", 0.0),
+            loc_get("lng", 0.0),
+            get("accuracy", ""),
+            get("accuracy_score", 0.0),
+            AddressComponents.from_dict(get("components") or {}),
+            get("other_names") or {},
         )
 
     def to_dict(self) -> dict:
@@ -83,7 +94,7 @@ class GeocodeResult:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GeocodeResponse:
     """Response from a geocode request."""
     query: str
@@ -106,7 +117,7 @@ class GeocodeResponse:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchGeocodeResponse:
     """Response from a batch geocode request."""
     results: List[GeocodeResponse]
@@ -117,8 +128,12 @@ class BatchGeocodeResponse:
     @classmethod
     def from_dict(cls, data: dict) -> "BatchGeocodeResponse":
         meta = data.get("meta", {})
+        # Same as GeocodeResponse.from_dict per item, inlined: up to 10,000
+        # items, so skip the extra classmethod dispatch for each.
+        parse = GeocodeResult.from_dict
+        response = GeocodeResponse
         results = [
-            GeocodeResponse.from_dict(r)
+            response(r.get("query", ""), [parse(x) for x in r.get("results", [])])
             for r in data.get("results", [])
         ]
         return cls(
@@ -127,3 +142,43 @@ class BatchGeocodeResponse:
             successful=meta.get("successful", len(results)),
             failed=meta.get("failed", 0),
         )
+
+
+class GeocodeRow(NamedTuple):
+    """Best match for one batch input, flattened.
+
+    Returned by the batch methods when called with ``raw=True``: a plain
+    tuple is several times cheaper to build than the GeocodeResponse /
+    GeocodeResult / AddressComponents trio, which adds up over 10,000
+    results. All fields but ``query`` are None when nothing was found.
+    """
+    query: str
+    formatted_address: Optional[str]
+    lat: Optional[float]
+    lng: Optional[float]
+    accuracy: Optional[str]
+    accuracy_score: Optional[float]
+
+    @classmethod
+    def list_from_batch(cls, data: dict) -> List["GeocodeRow"]:
+        """One row per item of a batch response's ``results``, in order."""
+        new = tuple.__new__
+        rows = []
+        append = rows.append
+        for r in data.get("results", []):
+            hits = r.get("results")
+            if hits:
+                b = hits[0]
+                get = b.get
+                location = get("location") or {}
+                append(new(cls, (
+                    r.get("query", ""),
+                    get("formatted_address", ""),
+                    location.get("lat", 0.0),
+                    location.get("lng", 0.0),
+                    get("accuracy", ""),
+                    get("accuracy_score", 0.0),
+                )))
+            else:
+                append(new(cls, (r.get("query", ""), None, None, None, None, None)))
+        return rows
@@ -0,0 +1,178 @@
+"""Unit tests for AsyncClient.
+
+These do NOT hit the network. ``_request`` is replaced with a coroutine
+that records the call and returns a canned response, mirroring the stub
+pattern in tests/test_routing.py. Skipped when aiohttp isn't installed.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from csv2geo import AsyncClient
+from csv2geo.client import _AIMDSemaphore
+from csv2geo.exceptions import APIError, RateLimitError
+
+
+def _hit(query):
+    return {
+        "query": query,
+        "results": [{
+            "formatted_address": query.upper(),
+            "location": {"lat": 1.0, "lng": 2.0},
+            "accuracy": "rooftop",
+            "accuracy_score": 1.0,
+        }],
+    }
+
+
+@pytest.fixture
+def client():
+    c = AsyncClient(api_key="dummy_key_for_unit_test")
+    c._captured = []
+
+    async def fake_request(method, path, params=None, json=None, **kw):
+        c._captured.append({"method": method, "path": path,
+                            "params": params, "json": json})
+        q = (params or {}).get("q", "")
+        if q == "boom":
+            raise APIError("server exploded", code="internal", status=500)
+        if q == "nowhere":
+            return {"query": q, "results": []}
+        return _hit(q)
+
+    c._request = fake_request
+    yield c
+    asyncio.run(c.close())
+
+
+def test_requires_api_key():
+    with pytest.raises(ValueError):
+        AsyncClient(api_key="")
+
+
+def test_geocode_forwards_params(client):
+    result = asyncio.run(client.geocode("1010 Vienna", country="AT", lang="de"))
+    call = client._captured[0]
+    assert call["method"] == "GET"
+    assert call["path"] == "/geocode"
+    assert call["params"] == {"q": "1010 Vienna", "country": "AT", "lang": "de"}
+    assert result.formatted_address == "1010 VIENNA"
+
+
+def test_reverse_forwards_radius(client):
+    asyncio.run(client.reverse(46.49125, -120.395, radius=1000))
+    call = client._captured[0]
+    assert call["path"] == "/reverse"
+    assert call["params"] == {"lat": 46.49125, "lng": -120.395, "radius": 1000}
+
+
+def test_geocode_many_preserves_order_and_isolates_errors(client):
+    addresses = ["a st", "nowhere", "boom", "b st"]
+    results = asyncio.run(client.geocode_many(addresses))
+    assert len(results) == 4
+    assert results[0].formatted_address == "A ST"
+    assert results[1] is None
+    assert isinstance(results[2], APIError)
+    assert results[3].formatted_address == "B ST"
+
+
+def test_geocode_many_respects_max_concurrency(client):
+    client.concurrency = 2
+    client.max_concurrency = 3
+    in_flight = {"now": 0, "peak": 0}
+
+    async def slow_request(method, path, params=None, json=None, **kw):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return _hit(params["q"])
+
+    client._request = slow_request
+    results = asyncio.run(client.geocode_many([f"{i} main st" for i in range(12)]))
+    assert len(results) == 12
+    assert in_flight["peak"] <= 3
+
+
+# ─────────────────────────────────────────────────────────
+# AIMD concurrency window
+# ─────────────────────────────────────────────────────────
+
+def _drive(sem, outcomes):
+    """Acquire/release once per outcome: a latency float or "congested"."""
+    async def run():
+        for outcome in outcomes:
+            await sem.acquire()
+            if outcome == "congested":
+                await sem.release(congested=True)
+            else:
+                await sem.release(latency=outcome)
+    asyncio.run(run())
+
+
+def test_aimd_additive_increase_under_target():
+    sem = _AIMDSemaphore(4, alpha=0.5, target_latency=1.0)
+    _drive(sem, [0.1] * 6)
+    assert sem.limit == 7.0
+
+
+def test_aimd_capped_at_c_max():
+    sem = _AIMDSemaphore(4, c_max=5, target_latency=1.0)
+    _drive(sem, [0.1] * 20)
+    assert sem.limit == 5.0
+
+
+def test_aimd_multiplicative_decrease_on_congestion():
+    sem = _AIMDSemaphore(16, beta=0.5)
+    _drive(sem, ["congested"])
+    assert sem.limit == 8.0
+
+
+def test_aimd_decreases_once_per_window():
+    """A burst of failures from one window halves the limit once, not
+    once per failure."""
+    sem = _AIMDSemaphore(16, beta=0.5)
+    _drive(sem, [0.1] * 16)           # grow to 24 and fill one window
+    _drive(sem, ["congested"] * 5)
+    assert sem.limit == 12.0
+
+
+def test_aimd_never_below_c_min():
+    sem = _AIMDSemaphore(2, c_min=1, beta=0.5)
+    _drive(sem, ["congested"] * 50)
+    assert sem.limit >= 1.0
+
+
+def test_aimd_decreases_when_latency_over_target():
+    sem = _AIMDSemaphore(4, target_latency=0.5)
+    _drive(sem, [0.1] * 4)
+    before = sem.limit
+    _drive(sem, [5.0])
+    assert sem.limit < before
+
+
+def test_geocode_many_backs_off_on_rate_limit(client):
+    client.concurrency = 8
+    limits = []
+
+    async def throttled(method, path, params=None, json=None, **kw):
+        await asyncio.sleep(0)
+        raise RateLimitError("slow down", status=429)
+
+    client._request = throttled
+    original = _AIMDSemaphore.release
+
+    async def spy(self, latency=None, congested=False):
+        await original(self, latency, congested)
+        limits.append(self.limit)
+
+    _AIMDSemaphore.release = spy
+    try:
+        results = asyncio.run(client.geocode_many([f"{i}" for i in range(20)]))
+    finally:
+        _AIMDSemaphore.release = original
+    assert all(isinstance(r, RateLimitError) for r in results)
+    assert min(limits) < 8
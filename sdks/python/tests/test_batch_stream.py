@@ -0,0 +1,120 @@
+"""Unit tests for Client.geocode_batch_iter (streamed batch parsing).
+
+These do NOT hit the network. ``client._session.request`` returns a
+``requests.Response`` whose raw stream is a urllib3 response over an
+in-memory body, so the ijson path reads it exactly as it would a socket.
+"""
+
+import gzip
+import io
+import json
+
+import pytest
+import requests
+import urllib3
+
+from csv2geo import Client
+from csv2geo import client as client_module
+from csv2geo.exceptions import AuthenticationError, InvalidRequestError
+
+
+BODY = {
+    "results": [
+        {"query": "1 Main St", "results": [
+            {"formatted_address": "1 MAIN ST", "location": {"lat": 1.5, "lng": 2.5},
+             "accuracy": "rooftop", "accuracy_score": 1.0},
+        ]},
+        {"query": "nowhere", "results": []},
+    ],
+    "meta": {"total": 2, "successful": 1, "failed": 1},
+}
+
+
+def _response(status, body, gzipped=False):
+    raw_bytes = json.dumps(body).encode()
+    headers = {}
+    if gzipped:
+        raw_bytes = gzip.compress(raw_bytes)
+        headers["Content-Encoding"] = "gzip"
+    r = requests.Response()
+    r.status_code = status
+    r.headers.update(headers)
+    r.raw = urllib3.HTTPResponse(
+        body=io.BytesIO(raw_bytes), headers=headers, status=status,
+        preload_content=False, decode_content=False,
+    )
+    return r
+
+
+@pytest.fixture
+def client():
+    c = Client(api_key="dummy")
+    c._calls = []
+    c._next = lambda: _response(200, BODY)
+
+    def fake_request(**kw):
+        c._calls.append(kw)
+        return c._next()
+
+    c._session.request = fake_request
+    yield c
+    c.close()
+
+
+@pytest.fixture(params=["ijson", "buffered"])
+def parser(request, monkeypatch):
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(client_module, "_load_ijson", lambda: None)
+    return request.param
+
+
+def test_yields_same_results_as_buffered_batch(client, parser):
+    streamed = list(client.geocode_batch_iter(["1 Main St", "nowhere"]))
+    client._next = lambda: _response(200, BODY)
+    buffered = client.geocode_batch(["1 Main St", "nowhere"])
+    assert streamed == buffered
+    assert streamed[0].best.lat == 1.5
+    assert isinstance(streamed[0].best.lat, float)
+    assert streamed[1].best is None
+
+
+def test_streams_only_when_ijson_available(client, parser):
+    list(client.geocode_batch_iter(["a"]))
+    assert client._calls[0].get("stream", False) is (parser == "ijson")
+    assert json.loads(client._calls[0]["data"]) == {"addresses": ["a"]}
+
+
+def test_gzip_encoded_body(client, parser):
+    client._next = lambda: _response(200, BODY, gzipped=True)
+    results = list(client.geocode_batch_iter(["1 Main St", "nowhere"]))
+    assert [r.query for r in results] == ["1 Main St", "nowhere"]
+
+
+def test_seeds_single_lookup_cache(client, parser):
+    list(client.geocode_batch_iter(["1 Main St", "nowhere"]))
+    client.geocode("1 main st")
+    assert len(client._calls) == 1
+
+
+def test_error_status_raises(client, parser):
+    client._next = lambda: _response(401, {"error": {"code": "invalid_api_key", "message": "bad"}})
+    with pytest.raises(AuthenticationError):
+        list(client.geocode_batch_iter(["a"]))
+
+
+def test_batch_limit_enforced(client):
+    with pytest.raises(InvalidRequestError):
+        client.geocode_batch_iter(["a"] * 10001)
+    assert client._calls == []
+
+
+def test_request_sent_on_call_not_first_next(client, parser):
+    client._next = lambda: _response(401, {"error": {"code": "invalid_api_key", "message": "bad"}})
+    with pytest.raises(AuthenticationError):
+        client.geocode_batch_iter(["a"])
+    client._next = lambda: _response(200, BODY)
+    it = client.geocode_batch_iter(["1 Main St", "nowhere"])
+    assert len(client._calls) == 2
+    assert [r.query for r in it] == ["1 Main St", "nowhere"]
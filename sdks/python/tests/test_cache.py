@@ -0,0 +1,217 @@
+"""Unit tests for the in-process geocode()/reverse() LRU cache.
+
+These do NOT hit the network. ``client._request`` is stubbed to count
+calls and return a canned single-result response, so every assertion is
+about whether the SDK went to the wire or answered from cache.
+"""
+
+import json as _json
+
+import pytest
+from csv2geo import Client
+
+
+def _hit(query):
+    return {
+        "query": query,
+        "results": [{
+            "formatted_address": str(query).upper(),
+            "location": {"lat": 1.0, "lng": 2.0},
+            "accuracy": "rooftop",
+            "accuracy_score": 1.0,
+        }],
+    }
+
+
+def _make_client(**kw):
+    c = Client(api_key="dummy_key_for_unit_test", **kw)
+    c._captured = []
+
+    def fake_request(method, path, params=None, json=None, body=None, **kw):
+        if body is not None:
+            json = _json.loads(body)
+        c._captured.append({"method": method, "path": path,
+                            "params": params, "json": json})
+        if json and "addresses" in json:
+            return {"results": [_hit(a) for a in json["addresses"]]}
+        if json and "coordinates" in json:
+            return {"results": [_hit(f"{c['lat']},{c['lng']}") for c in json["coordinates"]]}
+        return _hit((params or {}).get("q", "reverse"))
+
+    c._request = fake_request
+    return c
+
+
+@pytest.fixture
+def client():
+    c = _make_client()
+    yield c
+    c.close()
+
+
+def test_repeat_geocode_served_from_cache(client):
+    first = client.geocode("1600 Pennsylvania Ave")
+    second = client.geocode("1600 Pennsylvania Ave")
+    assert len(client._captured) == 1
+    assert second is first
+    info = client.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_geocode_key_ignores_case_and_whitespace(client):
+    client.geocode("1600 Pennsylvania Ave")
+    client.geocode("  1600 PENNSYLVANIA AVE ")
+    assert len(client._captured) == 1
+
+
+def test_geocode_key_includes_other_params(client):
+    client.geocode("Vienna")
+    client.geocode("Vienna", country="AT")
+    client.geocode("Vienna", country="AT", lang="de")
+    client.geocode("Vienna", country="AT", include_other_names=True)
+    assert len(client._captured) == 4
+
+
+def test_not_found_is_cached(client):
+    client._request = lambda *a, **kw: client._captured.append(a) or {"results": []}
+    assert client.geocode("nowhere") is None
+    assert client.geocode("nowhere") is None
+    assert len(client._captured) == 1
+
+
+def test_reverse_key_rounds_coordinates(client):
+    client.reverse(38.8977, -77.0365)
+    client.reverse(38.89770000001, -77.03650000001)
+    assert len(client._captured) == 1
+    client.reverse(38.8977, -77.0365, radius=500)
+    assert len(client._captured) == 2
+
+
+def test_full_variants_are_not_cached(client):
+    client.geocode_full("1600 Pennsylvania Ave")
+    client.geocode_full("1600 Pennsylvania Ave")
+    assert len(client._captured) == 2
+
+
+def test_cache_clear(client):
+    client.geocode("a st")
+    client.cache_clear()
+    assert client.cache_info().currsize == 0
+    client.geocode("a st")
+    assert len(client._captured) == 2
+
+
+def test_lru_eviction():
+    c = _make_client(cache_size=2)
+    c.geocode("a")
+    c.geocode("b")
+    c.geocode("a")      # refresh "a"; "b" is now least recent
+    c.geocode("c")      # evicts "b"
+    assert c.cache_info().currsize == 2
+    c.geocode("a")
+    assert len(c._captured) == 3
+    c.geocode("b")
+    assert len(c._captured) == 4
+    c.close()
+
+
+def test_cache_size_zero_disables_cache():
+    c = _make_client(cache_size=0)
+    c.geocode("a")
+    c.geocode("a")
+    assert len(c._captured) == 2
+    c.close()
+
+
+def test_geocode_batch_seeds_cache(client):
+    client.geocode_batch(["1 Main St", "2 Main St"])
+    assert len(client._captured) == 1
+    result = client.geocode("1 main st")
+    assert len(client._captured) == 1
+    assert result.formatted_address == "1 MAIN ST"
+
+
+def test_reverse_batch_seeds_cache(client):
+    client.reverse_batch([(38.8977, -77.0365), (40.7484, -73.9857)], radius=500)
+    assert len(client._captured) == 1
+    result = client.reverse(40.7484, -73.9857, radius=500)
+    assert len(client._captured) == 1
+    assert result.formatted_address == "40.7484,-73.9857"
+    # Different radius is a different question — goes to the network.
+    client.reverse(40.7484, -73.9857)
+    assert len(client._captured) == 2
+
+
+def test_reverse_batch_skips_unseedable_dicts(client):
+    client.reverse_batch([{"lat": "38.8977", "lng": "-77.0365"}])
+    assert client.cache_info().currsize == 0
+
+
+# ─────────────────────────────────────────────────────────
+# geocode_batch() — dedupe + cache short-circuit
+# ─────────────────────────────────────────────────────────
+
+def test_geocode_batch_sends_duplicates_once(client):
+    results = client.geocode_batch(["a st", "b st", "a st", "a st"])
+    assert client._captured[0]["json"] == {"addresses": ["a st", "b st"]}
+    assert [r.query for r in results] == ["a st", "b st", "a st", "a st"]
+    assert [r.best.formatted_address for r in results] == ["A ST", "B ST", "A ST", "A ST"]
+
+
+def test_geocode_batch_skips_cached_addresses(client):
+    client.geocode("a st")
+    results = client.geocode_batch(["A St ", "b st"])
+    assert client._captured[-1]["json"] == {"addresses": ["b st"]}
+    assert results[0].query == "A St "
+    assert results[0].best.formatted_address == "A ST"
+    assert results[1].best.formatted_address == "B ST"
+
+
+def test_geocode_batch_fully_cached_makes_no_request(client):
+    client.geocode_batch(["a st", "b st"])
+    client.geocode_batch(["b st", "a st", "b st"])
+    assert len(client._captured) == 1
+
+
+def test_geocode_batch_cached_not_found(client):
+    client._request = lambda *a, **kw: client._captured.append(a) or {"results": []}
+    client.geocode("nowhere")
+    results = client.geocode_batch(["nowhere"])
+    assert len(client._captured) == 1
+    assert results[0].best is None
+
+
+def test_geocode_batch_raw_rows_bypass_cache(client):
+    client.geocode("a st")
+    rows = client.geocode_batch(["a st", "b st", "a st"], raw=True)
+    assert client._captured[-1]["json"] == {"addresses": ["a st", "b st"]}
+    assert [r.query for r in rows] == ["a st", "b st", "a st"]
+    assert rows[1].formatted_address == "B ST"
+    assert client.cache_info().currsize == 1   # raw results are not cached
+
+
+def test_geocode_batch_non_string_inputs_sent_uncached(client):
+    nan = float("nan")
+    results = client.geocode_batch(["a st", None, nan, "a st"])
+    sent = client._captured[-1]["json"]["addresses"]
+    assert sent[:2] == ["a st", None] and len(sent) == 3   # NaN may encode as null
+    assert [r.query for r in results[:2]] == ["a st", None]
+    assert results[0] is results[3]
+    assert client.cache_info().currsize == 1   # only "a st"
+
+
+def test_geocode_batch_raw_rows_short_response_keeps_input_order(client):
+    # Server drops "b st": rows are matched on query, the gap is all-None.
+    client._request = lambda *a, **kw: {"results": [_hit("c st"), _hit("a st")]}
+    rows = client.geocode_batch(["a st", "b st", "a st", "c st"], raw=True)
+    assert [r.query for r in rows] == ["a st", "b st", "a st", "c st"]
+    assert rows[0].formatted_address == rows[2].formatted_address == "A ST"
+    assert rows[1] == ("b st", None, None, None, None, None)
+    assert rows[3].formatted_address == "C ST"
+
+
+def test_reverse_batch_raw_rows(client):
+    rows = client.reverse_batch([(1.0, 2.0)], raw=True)
+    assert rows[0].formatted_address == "1.0,2.0"
+    assert (rows[0].lat, rows[0].lng) == (1.0, 2.0)
+    assert client.cache_info().currsize == 0
@@ -0,0 +1,158 @@
+"""Unit tests for the optional httpx (HTTP/2) transport.
+
+These do NOT hit the network. After construction the client's httpx
+session is swapped for one backed by ``httpx.MockTransport`` so each
+test scripts the server side. Skipped when httpx isn't installed.
+"""
+
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from csv2geo import Client
+from csv2geo import client as client_module
+from csv2geo.exceptions import APIError
+
+
+OK = {"query": "x", "results": [{"formatted_address": "X", "location": {"lat": 1, "lng": 2}}]}
+
+
+def _client(handler, **kw):
+    c = Client(api_key="dummy", transport="httpx", **kw)
+    headers = dict(c._session.headers)
+    c._session.close()
+    c._session = httpx.Client(transport=httpx.MockTransport(handler), headers=headers)
+    return c
+
+
+def test_unknown_transport_rejected():
+    with pytest.raises(ValueError):
+        Client(api_key="dummy", transport="urllib")
+
+
+def test_builds_http2_client_with_sdk_headers():
+    c = Client(api_key="dummy", transport="httpx")
+    assert isinstance(c._session, httpx.Client)
+    assert c._session.headers["Authorization"] == "Bearer dummy"
+    assert c._session.headers["User-Agent"].startswith("csv2geo-python/")
+    c.close()
+
+
+def test_geocode_round_trip():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json=OK, headers={"X-RateLimit-Remaining": "99"})
+
+    c = _client(handler)
+    result = c.geocode("1 Main St", country="US")
+    assert result.formatted_address == "X"
+    assert seen[0].url.params["q"] == "1 Main St"
+    assert seen[0].url.params["country"] == "US"
+    assert seen[0].headers["Authorization"] == "Bearer dummy"
+    assert c.rate_limit_remaining == "99"
+
+
+def test_none_params_are_dropped():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    c = _client(handler)
+    c._request("GET", "/timezone", params={"lat": 1, "lng": 2, "tz": None})
+    assert "tz" not in seen[0].url.params
+
+
+def test_batch_posts_json_body():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"results": []})
+
+    c = _client(handler)
+    c.geocode_batch(["a", "b"])
+    assert seen[0].method == "POST"
+    assert json.loads(seen[0].content) == {"addresses": ["a", "b"]}
+
+
+def test_5xx_retried_in_client(monkeypatch):
+    monkeypatch.setattr(client_module.time, "sleep", lambda s: None)
+    statuses = iter([503, 502, 200])
+
+    def handler(request):
+        status = next(statuses)
+        return httpx.Response(status, json=OK if status == 200 else {})
+
+    c = _client(handler)
+    assert c.geocode("x").formatted_address == "X"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(client_module.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_timeout_retried_then_mapped_to_api_error(sleeps):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ReadTimeout("slow", request=request)
+
+    c = _client(handler)
+    with pytest.raises(APIError) as exc:
+        c._request("GET", "/geocode", params={"q": "x"})
+    assert exc.value.code == "timeout"
+    assert len(calls) == Client.MAX_RETRIES + 1
+    assert len(sleeps) == Client.MAX_RETRIES
+
+
+def test_connect_error_retried_then_mapped_to_api_error(sleeps):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("refused", request=request)
+
+    c = _client(handler)
+    with pytest.raises(APIError) as exc:
+        c._request("GET", "/geocode", params={"q": "x"})
+    assert exc.value.code == "connection_error"
+    assert len(calls) == Client.MAX_RETRIES + 1
+
+
+def test_dropped_connection_retried(sleeps):
+    outcomes = iter([httpx.RemoteProtocolError, httpx.ReadTimeout, None])
+
+    def handler(request):
+        error = next(outcomes)
+        if error is not None:
+            raise error("boom", request=request)
+        return httpx.Response(200, json=OK)
+
+    c = _client(handler)
+    assert c.geocode("x").formatted_address == "X"
+    assert len(sleeps) == 2
+
+
+def test_transport_errors_not_retried_without_auto_retry(sleeps):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ReadTimeout("slow", request=request)
+
+    c = _client(handler, auto_retry=False)
+    with pytest.raises(APIError) as exc:
+        c._request("GET", "/geocode", params={"q": "x"})
+    assert exc.value.code == "timeout"
+    assert len(calls) == 1
+    assert sleeps == []
@@ -0,0 +1,150 @@
+"""Unit tests for JSON encoding/decoding on the request path.
+
+These do NOT hit the network. They feed canned ``requests.Response``
+objects through _handle_response, and capture the batch request bodies
+handed to the session, with both JSON backends: orjson when installed,
+and the stdlib fallback used when it isn't.
+"""
+
+import gzip
+import json
+
+import pytest
+import requests
+
+from csv2geo import Client
+from csv2geo import client as client_module
+from csv2geo.exceptions import APIError, InvalidRequestError
+
+
+def _response(status, content, headers=None):
+    r = requests.Response()
+    r.status_code = status
+    r._content = content
+    r.headers.update(headers or {})
+    return r
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def client(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(client_module, "_json_loads", json.loads)
+        monkeypatch.setattr(
+            client_module, "_json_dumps",
+            lambda obj: json.dumps(obj, separators=(",", ":")).encode("utf-8"),
+        )
+    c = Client(api_key="dummy")
+    yield c
+    c.close()
+
+
+def test_success_body_decoded(client):
+    body = {"query": "Zürich", "results": [{"formatted_address": "Zürich, CH"}]}
+    data = client._handle_response(
+        _response(200, json.dumps(body, ensure_ascii=False).encode("utf-8"))
+    )
+    assert data == body
+
+
+def test_error_envelope_decoded(client):
+    body = {"error": {"code": "invalid_query", "message": "q is required", "status": 400}}
+    with pytest.raises(InvalidRequestError) as exc:
+        client._handle_response(_response(400, json.dumps(body).encode()))
+    assert exc.value.code == "invalid_query"
+    assert exc.value.message == "q is required"
+
+
+def test_non_json_error_falls_back_to_text(client):
+    with pytest.raises(APIError) as exc:
+        client._handle_response(_response(500, b"<html>Bad Gateway</html>"))
+    assert exc.value.code == "unknown"
+    assert exc.value.message == "<html>Bad Gateway</html>"
+
+
+def test_batch_bodies_sent_pre_encoded(client):
+    sent = []
+
+    def fake_request(**kw):
+        sent.append(kw)
+        return _response(200, b'{"results": []}')
+
+    client._session.request = fake_request
+    client.geocode_batch(["Zürich", "1 Main St"])
+    client.reverse_batch([(47.37, 8.54)])
+    for kw in sent:
+        assert "json" not in kw
+        assert isinstance(kw["data"], bytes)
+    assert json.loads(sent[0]["data"]) == {"addresses": ["Zürich", "1 Main St"]}
+    assert json.loads(sent[1]["data"]) == {"coordinates": [{"lat": 47.37, "lng": 8.54}]}
+    assert client._session.headers["Content-Type"] == "application/json"
+
+
+def test_batch_bodies_accept_numpy_scalars(client):
+    np = pytest.importorskip("numpy")
+    sent = _capture(client)
+    lats, lngs = np.array([47.37, 40.75]), np.array([8.54, -73.99])
+    client.reverse_batch(list(zip(lats, lngs)))
+    client.reverse_batch([{"lat": np.float64(1.0), "lng": np.float64(2.0)}])
+    assert json.loads(sent[0]["data"]) == {"coordinates": [
+        {"lat": 47.37, "lng": 8.54}, {"lat": 40.75, "lng": -73.99},
+    ]}
+    assert json.loads(sent[1]["data"]) == {"coordinates": [{"lat": 1.0, "lng": 2.0}]}
+
+
+def test_batch_bodies_accept_float_subclasses(client):
+    class Degrees(float):
+        pass
+
+    sent = _capture(client)
+    client.reverse_batch([(Degrees(1.5), Degrees(2.5))])
+    assert json.loads(sent[0]["data"]) == {"coordinates": [{"lat": 1.5, "lng": 2.5}]}
+
+
+def _capture(client):
+    sent = []
+
+    def fake_request(**kw):
+        sent.append(kw)
+        return _response(200, b'{"results": []}')
+
+    client._session.request = fake_request
+    return sent
+
+
+def test_large_batch_body_gzipped_when_enabled(client):
+    client.compress_requests = True
+    sent = _capture(client)
+    addresses = [f"{i} Main St, Springfield" for i in range(200)]
+    client.geocode_batch(addresses)
+    assert sent[0]["headers"] == {"Content-Encoding": "gzip"}
+    assert json.loads(gzip.decompress(sent[0]["data"])) == {"addresses": addresses}
+
+
+def test_small_batch_body_not_gzipped(client):
+    client.compress_requests = True
+    sent = _capture(client)
+    client.geocode_batch(["1 Main St"])
+    assert sent[0]["headers"] is None
+    assert json.loads(sent[0]["data"]) == {"addresses": ["1 Main St"]}
+
+
+def test_compression_off_by_default(client):
+    sent = _capture(client)
+    client.geocode_batch([f"{i} Main St, Springfield" for i in range(200)])
+    assert sent[0]["headers"] is None
+
+
+def test_rate_limit_headers_exposed(client):
+    assert (client.rate_limit, client.rate_limit_remaining, client.rate_limit_reset) == (None, None, None)
+    client._handle_response(_response(200, b"{}", headers={
+        "X-RateLimit-Limit": "60",
+        "X-RateLimit-Remaining": "59",
+        "X-RateLimit-Reset": "1790000000",
+    }))
+    assert (client.rate_limit, client.rate_limit_remaining, client.rate_limit_reset) == (
+        "60", "59", "1790000000",
+    )
+    with pytest.raises(InvalidRequestError):
+        client._handle_response(_response(400, b"{}", headers={"X-RateLimit-Remaining": "58"}))
+    assert client.rate_limit_remaining == "58"
+    assert client.rate_limit is None
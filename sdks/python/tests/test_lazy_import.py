@@ -0,0 +1,53 @@
+"""Import-cost guard: `import csv2geo` must not pull in the HTTP stack.
+
+Runs in a fresh interpreter so modules imported by other tests don't
+leak into sys.modules. Does NOT hit the network.
+"""
+
+import subprocess
+import sys
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+
+def test_package_import_does_not_load_client():
+    out = _run(
+        "import sys, csv2geo\n"
+        "from csv2geo import Location, GeocodeResult, CSV2GEOError\n"
+        "print('requests' in sys.modules, 'csv2geo.client' in sys.modules)"
+    )
+    assert out == "False False"
+
+
+def test_client_resolved_on_first_access():
+    out = _run(
+        "import csv2geo\n"
+        "from csv2geo import Client, AsyncClient\n"
+        "from csv2geo.client import Client as C\n"
+        "print(Client is C, 'Client' in csv2geo.__all__, 'AsyncClient' in csv2geo.__all__)"
+    )
+    assert out == "True True True"
+
+
+def test_sync_client_does_not_load_optional_backends():
+    out = _run(
+        "import sys\n"
+        "from csv2geo import Client\n"
+        "Client('dummy').close()\n"
+        "print([m for m in ('aiohttp', 'httpx', 'ijson') if m in sys.modules])"
+    )
+    assert out == "[]"
+
+
+def test_unknown_attribute_still_raises():
+    import csv2geo
+    try:
+        csv2geo.NotAThing
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("expected AttributeError")
@@ -0,0 +1,112 @@
+"""Unit tests for response model parsing.
+
+These do NOT hit the network. They pin the from_dict() contract — field
+mapping and defaults for missing/null keys — for the single and batch
+response shapes.
+"""
+
+import dataclasses
+import sys
+
+import pytest
+
+from csv2geo.models import (
+    AddressComponents,
+    BatchGeocodeResponse,
+    GeocodeResponse,
+    GeocodeResult,
+    GeocodeRow,
+    Location,
+)
+
+
+FULL = {
+    "formatted_address": "1600 PENNSYLVANIA AVE NW, WASHINGTON, DC 20500, US",
+    "location": {"lat": 38.8977, "lng": -77.0365},
+    "accuracy": "rooftop",
+    "accuracy_score": 1.0,
+    "components": {
+        "house_number": "1600",
+        "street": "PENNSYLVANIA AVE NW",
+        "city": "WASHINGTON",
+        "state": "DC",
+        "postcode": "20500",
+        "country": "US",
+    },
+    "other_names": {"country": {"de": "Vereinigte Staaten"}},
+}
+
+
+def test_result_from_dict_maps_every_field():
+    r = GeocodeResult.from_dict(FULL)
+    assert r.formatted_address == FULL["formatted_address"]
+    assert (r.lat, r.lng) == (38.8977, -77.0365)
+    assert r.accuracy == "rooftop"
+    assert r.accuracy_score == 1.0
+    assert r.components == AddressComponents(
+        house_number="1600", street="PENNSYLVANIA AVE NW", unit=None,
+        city="WASHINGTON", state="DC", postcode="20500", country="US",
+    )
+    assert r.other_names == {"country": {"de": "Vereinigte Staaten"}}
+    assert r.location == Location(38.8977, -77.0365)
+
+
+@pytest.mark.parametrize("data", [{}, {"location": None, "components": None, "other_names": None}])
+def test_result_from_dict_defaults(data):
+    r = GeocodeResult.from_dict(data)
+    assert r.formatted_address == ""
+    assert (r.lat, r.lng) == (0.0, 0.0)
+    assert r.accuracy == ""
+    assert r.accuracy_score == 0.0
+    assert r.components == AddressComponents()
+    assert r.other_names == {}
+
+
+def test_batch_from_dict_matches_single_parse():
+    item = {"query": "1600 Pennsylvania Ave", "results": [FULL, {}]}
+    batch = BatchGeocodeResponse.from_dict({
+        "results": [item, {"query": "nowhere", "results": []}],
+        "meta": {"total": 2, "successful": 1, "failed": 1},
+    })
+    assert batch.results[0] == GeocodeResponse.from_dict(item)
+    assert batch.results[1].query == "nowhere"
+    assert batch.results[1].best is None
+    assert (batch.total, batch.successful, batch.failed) == (2, 1, 1)
+
+
+def test_batch_meta_defaults():
+    batch = BatchGeocodeResponse.from_dict({"results": [{"query": "a"}]})
+    assert (batch.total, batch.successful, batch.failed) == (1, 1, 0)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+@pytest.mark.parametrize("cls", [
+    Location, AddressComponents, GeocodeResult, GeocodeResponse, BatchGeocodeResponse,
+])
+def test_models_have_no_instance_dict(cls):
+    instance = cls(*[None] * len(dataclasses.fields(cls)))
+    assert not hasattr(instance, "__dict__")
+
+
+def test_rows_from_batch():
+    rows = GeocodeRow.list_from_batch({"results": [
+        {"query": "1600 Pennsylvania Ave", "results": [FULL, {}]},
+        {"query": "nowhere", "results": []},
+        {"query": "sparse", "results": [{}]},
+    ]})
+    assert rows == [
+        ("1600 Pennsylvania Ave", FULL["formatted_address"], 38.8977, -77.0365, "rooftop", 1.0),
+        ("nowhere", None, None, None, None, None),
+        ("sparse", "", 0.0, 0.0, "", 0.0),
+    ]
+    assert rows[0].lat == 38.8977
+    assert isinstance(rows[0], GeocodeRow)
+
+
+def test_rows_match_dataclass_best():
+    data = {"results": [{"query": "q", "results": [FULL]}]}
+    row = GeocodeRow.list_from_batch(data)[0]
+    best = BatchGeocodeResponse.from_dict(data).results[0].best
+    assert (row.formatted_address, row.lat, row.lng, row.accuracy, row.accuracy_score) == (
+        best.formatted_address, best.lat, best.lng, best.accuracy, best.accuracy_score,
+    )
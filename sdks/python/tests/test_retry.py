@@ -0,0 +1,246 @@
+"""Unit tests for Client._request retry/backoff.
+
+These do NOT hit the network. ``client._session.request`` is replaced with
+a scripted sequence of canned ``requests.Response`` objects / exceptions,
+and ``time.sleep`` is patched to record the delays instead of waiting.
+"""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from csv2geo import Client
+from csv2geo import client as client_module
+from csv2geo.exceptions import APIError, RateLimitError, InvalidRequestError
+
+
+def _response(status, body=None, headers=None):
+    r = requests.Response()
+    r.status_code = status
+    r._content = json.dumps(body if body is not None else {}).encode()
+    r.headers.update(headers or {})
+    return r
+
+
+OK = {"query": "x", "results": []}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(client_module.time, "sleep", recorded.append)
+    return recorded
+
+
+def _scripted(client, *outcomes):
+    outcomes = list(outcomes)
+    calls = []
+
+    def fake_request(**kw):
+        calls.append(kw)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    client._session.request = fake_request
+    return calls
+
+
+def test_429_honors_retry_after(sleeps):
+    c = Client(api_key="dummy")
+    calls = _scripted(c, _response(429, headers={"Retry-After": "7"}), _response(200, OK))
+    assert c._request("GET", "/geocode") == OK
+    assert len(calls) == 2
+    assert sleeps == [7]
+
+
+def test_429_without_retry_after_backs_off_exponentially(sleeps):
+    c = Client(api_key="dummy")
+    _scripted(c, *[_response(429)] * 3, _response(200, OK))
+    c._request("GET", "/geocode")
+    assert len(sleeps) == 3
+    for attempt, delay in enumerate(sleeps):
+        ceiling = (2 ** attempt) * c.RETRY_DELAY
+        assert ceiling * 0.5 <= delay <= ceiling
+
+
+def test_long_retry_after_capped_at_60(sleeps):
+    c = Client(api_key="dummy")
+    _scripted(c, _response(429, headers={"Retry-After": "3600"}), _response(200, OK))
+    c._request("GET", "/geocode")
+    assert sleeps == [60]
+
+
+def test_429_gives_up_after_max_retries(sleeps):
+    c = Client(api_key="dummy")
+    calls = _scripted(c, *[_response(429)] * (c.MAX_RETRIES + 1))
+    with pytest.raises(RateLimitError) as exc:
+        c._request("GET", "/geocode")
+    assert exc.value.retry_after is None
+    assert len(calls) == c.MAX_RETRIES + 1
+
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_transient_5xx_left_to_transport(sleeps, status):
+    """5xx retries live in the urllib3 adapter; a 5xx that reaches
+    _request has already exhausted them and must not be retried again."""
+    c = Client(api_key="dummy")
+    calls = _scripted(c, _response(status))
+    with pytest.raises(APIError) as exc:
+        c._request("GET", "/geocode")
+    assert exc.value.status == status
+    assert len(calls) == 1
+
+
+def test_500_and_400_are_not_retried(sleeps):
+    c = Client(api_key="dummy")
+    _scripted(c, _response(500))
+    with pytest.raises(APIError):
+        c._request("GET", "/geocode")
+    _scripted(c, _response(400))
+    with pytest.raises(InvalidRequestError):
+        c._request("GET", "/geocode")
+    assert sleeps == []
+
+
+def test_connection_error_wrapped(sleeps):
+    c = Client(api_key="dummy")
+    _scripted(c, requests.exceptions.ConnectionError())
+    with pytest.raises(APIError) as exc:
+        c._request("GET", "/geocode")
+    assert exc.value.code == "connection_error"
+
+
+def test_timeout_wrapped(sleeps):
+    c = Client(api_key="dummy")
+    _scripted(c, requests.exceptions.Timeout())
+    with pytest.raises(APIError) as exc:
+        c._request("GET", "/geocode")
+    assert exc.value.code == "timeout"
+
+
+# ─────────────────────────────────────────────────────────
+# Transport adapter (urllib3 Retry + pool sizing)
+# ─────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("scheme", ["https://", "http://"])
+def test_adapter_mounted_with_pool_and_retry(scheme):
+    c = Client(api_key="dummy")
+    adapter = c._session.get_adapter(scheme + "csv2geo.com")
+    assert adapter._pool_maxsize == Client.POOL_MAXSIZE
+    retry = adapter.max_retries
+    assert retry.connect == retry.read == Client.MAX_RETRIES
+    assert set(retry.status_forcelist) == {502, 503, 504}
+    assert 429 not in retry.status_forcelist
+    assert {"GET", "POST"} <= set(retry.allowed_methods)
+    assert retry.raise_on_status is False
+    assert retry.respect_retry_after_header is False
+    c.close()
+
+
+def test_adapter_retry_disabled_with_auto_retry_off():
+    c = Client(api_key="dummy", auto_retry=False)
+    retry = c._session.get_adapter("https://csv2geo.com").max_retries
+    assert retry.total == 0
+    c.close()
+
+
+def test_auto_retry_off_raises_immediately(sleeps):
+    c = Client(api_key="dummy", auto_retry=False)
+    calls = _scripted(c, _response(503))
+    with pytest.raises(APIError):
+        c._request("GET", "/geocode")
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+# ─────────────────────────────────────────────────────────
+# Through the real mounted adapter (local HTTP server, no internet)
+# ─────────────────────────────────────────────────────────
+
+@pytest.fixture
+def server():
+    """Local HTTP server replying with a scripted list of
+    (status, headers) tuples; records every request it receives. A status
+    of None stalls without answering until the test ends."""
+    state = {"script": [], "hits": 0}
+    release = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["hits"] += 1
+            status, headers = (
+                state["script"].pop(0) if state["script"] else (200, {})
+            )
+            if status is None:
+                release.wait(5)
+                return
+            body = json.dumps(OK if status == 200 else {}).encode()
+            self.send_response(status)
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield state
+    release.set()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.parametrize("retry_after", ["1", "3600"])
+def test_429_is_one_wire_request_per_attempt(server, sleeps, retry_after):
+    """urllib3 must not retry 429 itself (even with Retry-After): every
+    application attempt in _request maps to exactly one request on the wire."""
+    server["script"] = [(429, {"Retry-After": retry_after})] * (Client.MAX_RETRIES + 1)
+    c = Client(api_key="dummy", base_url=server["url"], cache_size=0)
+    with pytest.raises(RateLimitError):
+        c._request("GET", "/geocode")
+    assert server["hits"] == Client.MAX_RETRIES + 1
+    assert len(sleeps) == Client.MAX_RETRIES
+    assert max(sleeps) <= 60
+    c.close()
+
+
+def test_503_retried_by_adapter_without_honoring_retry_after(server, sleeps):
+    server["script"] = [(503, {"Retry-After": "3600"}), (200, {})]
+    c = Client(api_key="dummy", base_url=server["url"])
+    assert c._request("GET", "/geocode") == OK
+    assert server["hits"] == 2
+    assert all(s <= 60 for s in sleeps)
+    c.close()
+
+
+def test_read_timeout_reported_as_timeout(server, sleeps):
+    """urllib3 retries read timeouts and requests then raises
+    ConnectionError, not ReadTimeout; it must still surface as a timeout."""
+    server["script"] = [(None, {})] * (Client.MAX_RETRIES + 1)
+    c = Client(api_key="dummy", base_url=server["url"], timeout=0.2)
+    with pytest.raises(APIError) as exc:
+        c._request("GET", "/geocode")
+    assert exc.value.code == "timeout"
+    c.close()
+
+
+def test_refused_connection_reported_as_connection_error(sleeps):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]   # closed again: nothing listens here
+    c = Client(api_key="dummy", base_url=f"http://127.0.0.1:{port}")
+    with pytest.raises(APIError) as exc:
+        c._request("GET", "/geocode")
+    assert exc.value.code == "connection_error"
+    c.close()
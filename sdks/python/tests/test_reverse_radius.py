@@ -13,6 +13,8 @@ radius=N; if they don't, the SDK doesn't forward anything (server applies
 default)."
 """
 
+import json as _json
+
 import pytest
 from csv2geo import Client
 
@@ -23,7 +25,11 @@ def client():
     c = Client(api_key="dummy_key_for_unit_test")
     c._captured = []
 
-    def fake_request(method, path, params=None, json=None, **kw):
+    def fake_request(method, path, params=None, json=None, body=None, **kw):
+        # Batch methods send a pre-encoded body; decode it so assertions
+        # can compare payloads regardless of how they were serialized.
+        if body is not None:
+            json = _json.loads(body)
         c._captured.append({"method": method, "path": path,
                             "params": params, "json": json})
         # Return a minimal-valid response shape so from_dict() doesn't blow up.
@@ -125,3 +131,53 @@ def test_reverse_batch_radius_combines_with_lang(client):
     params = client._captured[0]["params"]
     assert params["radius"] == 500
     assert params.get("lang") == "de"
+
+
+# ─────────────────────────────────────────────────────────
+# reverse_batch() — coordinate normalization
+# ─────────────────────────────────────────────────────────
+
+def test_reverse_batch_accepts_every_coordinate_shape(client):
+    from collections import namedtuple
+    from csv2geo import Location
+    LatLng = namedtuple("LatLng", "lat lng")
+    client.reverse_batch([
+        (1.0, 2.0),
+        [3.0, 4.0],
+        Location(lat=5.0, lng=6.0),
+        {"lat": 7.0, "lng": 8.0},
+        LatLng(9.0, 10.0),
+    ])
+    assert client._captured[0]["json"]["coordinates"] == [
+        {"lat": 1.0, "lng": 2.0},
+        {"lat": 3.0, "lng": 4.0},
+        {"lat": 5.0, "lng": 6.0},
+        {"lat": 7.0, "lng": 8.0},
+        {"lat": 9.0, "lng": 10.0},
+    ]
+
+
+def test_reverse_batch_rejects_unknown_coordinate_type(client):
+    from csv2geo.exceptions import InvalidRequestError
+    with pytest.raises(InvalidRequestError):
+        client.reverse_batch([(1.0, 2.0), "1.0,2.0"])
+    assert client._captured == []
+
+
+def test_reverse_batch_accepts_numpy_array(client):
+    np = pytest.importorskip("numpy")
+    coords = np.array([[38.8977, -77.0365], [40.7484, -73.9857]])
+    client.reverse_batch(coords, radius=500)
+    payload = client._captured[0]["json"]["coordinates"]
+    assert payload == [
+        {"lat": 38.8977, "lng": -77.0365},
+        {"lat": 40.7484, "lng": -73.9857},
+    ]
+    assert type(payload[0]["lat"]) is float
+
+
+def test_reverse_batch_rejects_badly_shaped_array(client):
+    np = pytest.importorskip("numpy")
+    from csv2geo.exceptions import InvalidRequestError
+    with pytest.raises(InvalidRequestError):
+        client.reverse_batch(np.zeros((3, 3)))
@@ -0,0 +1,129 @@
+"""Unit tests for proactive throttling in Client._request.
+
+These do NOT hit the network and do NOT really sleep: the session is
+stubbed with canned 200 responses and the module's clock/sleep are
+replaced with a fake clock that advances only when "slept".
+"""
+
+import json
+
+import pytest
+import requests
+
+from csv2geo import Client
+from csv2geo import client as client_module
+
+
+class FakeClock:
+    def __init__(self, start=1_000_000.0):
+        self.now = start
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = FakeClock()
+    monkeypatch.setattr(client_module.time, "monotonic", c.monotonic)
+    monkeypatch.setattr(client_module.time, "time", c.time)
+    monkeypatch.setattr(client_module.time, "sleep", c.sleep)
+    return c
+
+
+def _ok(headers=None):
+    r = requests.Response()
+    r.status_code = 200
+    r._content = json.dumps({"query": "x", "results": []}).encode()
+    r.headers.update(headers or {})
+    return r
+
+
+def _client(headers=None, **kw):
+    c = Client(api_key="dummy", **kw)
+    c._session.request = lambda **_: _ok(headers)
+    return c
+
+
+def test_no_throttle_by_default(clock):
+    c = _client()
+    for _ in range(100):
+        c._request("GET", "/geocode")
+    assert clock.sleeps == []
+
+
+def test_rpm_limit_sliding_window(clock):
+    c = _client(rpm_limit=3)
+    for _ in range(3):
+        c._request("GET", "/geocode")
+        clock.now += 5
+    assert clock.sleeps == []
+    # 4th call at t=15 must wait for the t=0 call to leave the window.
+    c._request("GET", "/geocode")
+    assert clock.sleeps == [pytest.approx(45)]
+
+
+def test_rpm_limit_reservations_from_concurrent_callers(clock, monkeypatch):
+    """Callers that reserved a slot but are still asleep must not be double
+    booked: no 60 s span may hold more than rpm_limit reservations."""
+    delays = []
+    monkeypatch.setattr(client_module.time, "sleep", delays.append)
+    c = _client(rpm_limit=3)
+    for _ in range(10):
+        c._wait_if_throttled()  # clock frozen: all ten are "concurrent"
+    assert delays == [pytest.approx(d) for d in (60, 60, 60, 120, 120, 120, 180)]
+    slots = list(c._call_times)
+    assert all(b - a >= 60 for a, b in zip(slots, slots[3:]))
+
+
+def test_header_throttle_waits_for_near_reset(clock):
+    headers = {
+        "X-RateLimit-Limit": "60",
+        "X-RateLimit-Remaining": "2",
+        "X-RateLimit-Reset": str(int(clock.now) + 20),
+    }
+    c = _client(headers)
+    c._request("GET", "/geocode")       # learns headers
+    assert clock.sleeps == []
+    c._request("GET", "/geocode")
+    assert clock.sleeps == [pytest.approx(20)]
+
+
+def test_header_throttle_ignores_distant_reset(clock):
+    """A daily quota resetting hours from now is not worth blocking on."""
+    headers = {
+        "X-RateLimit-Limit": "3000",
+        "X-RateLimit-Remaining": "1",
+        "X-RateLimit-Reset": str(int(clock.now) + 3600),
+    }
+    c = _client(headers)
+    c._request("GET", "/geocode")
+    c._request("GET", "/geocode")
+    assert clock.sleeps == []
+
+
+def test_header_throttle_off_without_auto_retry(clock):
+    headers = {
+        "X-RateLimit-Limit": "60",
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(int(clock.now) + 20),
+    }
+    c = _client(headers, auto_retry=False)
+    c._request("GET", "/geocode")
+    c._request("GET", "/geocode")
+    assert clock.sleeps == []
+
+
+def test_malformed_headers_are_ignored(clock):
+    c = _client({"X-RateLimit-Remaining": "lots", "X-RateLimit-Reset": "soon"})
+    c._request("GET", "/geocode")
+    c._request("GET", "/geocode")
+    assert clock.sleeps == []